@@ -8,47 +8,245 @@ Chaque fonction correspond à une commande CLI et gère:
 - La coordination avec le module core pour la logique métier
 """
 
+import atexit
+import os
+import time
+
 import core
-from datetime import datetime
+
+# Fichier d'historique partagé: les lignes s'accumulent en mémoire et
+# partent en une seule écriture vectorisée (os.writev) au flush, sur un
+# descripteur ouvert une seule fois par processus.
+_HISTORY_FILE = "historique.txt"
+_history_fd = None
+_history_pending = []
+
+# Horodatage formaté, mis en cache à la seconde près: strftime est un appel
+# coûteux (analyse du format, locale) pour un résultat constant dans la seconde.
+_ts_cache = [0, ""]
+
 
 def get_current_datetime():
-    """Retourne la date et l'heure actuelle sous forme de chaîne."""
-    now = datetime.now()
-    return now.strftime("%Y-%m-%d %H:%M:%S")
+    """Retourne la date et l'heure actuelle sous forme de chaîne (cache à la seconde)."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        # time.strftime/localtime sont des appels C directs: pas d'objet
+        # datetime intermédiaire ni de module supplémentaire à charger
+        _ts_cache[0] = t
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+    return _ts_cache[1]
+
+
+def _parse_id(task_id):
+    """Convertit l'ID reçu de la ligne de commande en entier, None si invalide."""
+    task_id = task_id.strip()
+    # Prédicat plutôt qu'exception: un ID invalide est un cas attendu
+    if task_id.isdecimal() or (task_id[:1] == "-" and task_id[1:].isdecimal()):
+        return int(task_id)
+    return None
+
+
+def _history_write(line):
+    """
+    Met en file une ligne d'historique, encodée une seule fois.
+
+    Les lignes accumulées partent ensemble au prochain flush_history()
+    (appelé par task.py en fin de dispatch, et en dernier recours à la
+    sortie du processus) en un unique appel système vectorisé.
+    """
+    _history_pending.append(line.encode())
+
+
+def flush_history():
+    """
+    Écrit d'un coup les lignes d'historique en attente (os.writev).
+
+    Le descripteur est ouvert en O_APPEND au premier flush puis réutilisé:
+    quel que soit le nombre de commandes de la session, l'historique coûte
+    une ouverture et un writev par flush, pas un open/write/close par ligne.
+    """
+    global _history_fd
+    if not _history_pending:
+        return
+    if _history_fd is None:
+        _history_fd = os.open(_HISTORY_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    os.writev(_history_fd, _history_pending)
+    _history_pending.clear()
+
+
+def _history_atexit():
+    """Filet de sécurité: vide la file puis ferme le descripteur à la sortie."""
+    flush_history()
+    if _history_fd is not None:
+        os.close(_history_fd)
+
+
+atexit.register(_history_atexit)
+
+
+# Descripteurs d'ajout en cache par fichier: pour une ligne ajoutée, inutile
+# de reconstruire un écrivain texte bufferisé à chaque commande
+_append_fds = {}
+
+
+def _append_line(filename, line):
+    """
+    Ajoute une ligne en fin de fichier via un descripteur gardé en cache.
+
+    Le descripteur est ouvert en O_APPEND au premier ajout puis réutilisé
+    (et fermé à la sortie): l'écriture se réduit à un os.write direct, sans
+    repasser par open()/close() à chaque commande.
+    """
+    fd = _append_fds.get(filename)
+    if fd is None:
+        fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        _append_fds[filename] = fd
+        atexit.register(os.close, fd)
+    os.write(fd, line.encode())
+
+
+def _write_back(store, new_lines):
+    """
+    Réécrit le fichier de tâches en ne touchant que les octets modifiés.
+
+    Args:
+        store (core.TaskStore): Fichier ouvert pour l'invocation; son
+            descripteur lecture/écriture est réutilisé, aucune réouverture
+            par écriture
+        new_lines (list): Lignes à obtenir après écriture
+
+    Note:
+        - Les lignes identiques en tête de fichier ne sont pas réécrites
+        - Si une seule ligne change sans changer de longueur (cas typique
+          d'une modification de statut), seule cette ligne est écrite
+        - Sinon, le fichier est réécrit à partir de la première différence
+          puis tronqué (cas de rm, ou d'une description plus longue)
+    """
+
+    old_lines = store.lines
+    filename = store.filename
+
+    # Trouve la première ligne différente
+    i = 0
+    limit = min(len(old_lines), len(new_lines))
+    while i < limit and old_lines[i] == new_lines[i]:
+        i += 1
+
+    # Aucune différence: rien à écrire
+    if i == len(old_lines) and i == len(new_lines):
+        return
+
+    # Tout diffère dès la première ligne: réécriture complète atomique,
+    # en une seule écriture, via un fichier temporaire remplacé d'un coup
+    if i == 0:
+        tmp = filename + '.tmp'
+        with open(tmp, 'w', buffering=262144) as f:
+            f.write("".join(new_lines))
+        os.replace(tmp, filename)
+        # Le descripteur du store pointe sur l'ancien inode: on le rouvre
+        store.reopen()
+        return
+
+    # Position en octets de la première ligne modifiée
+    offset = sum(len(line.encode()) for line in old_lines[:i])
+
+    # Réutilise le descripteur du store (un seul open par invocation)
+    fd = store.fd if store.fd is not None else os.open(filename, os.O_WRONLY)
+    try:
+        new_bytes = new_lines[i].encode() if i < len(new_lines) else b""
+        if (i < limit and old_lines[i + 1:] == new_lines[i + 1:]
+                and len(old_lines[i].encode()) == len(new_bytes)):
+            # Une seule ligne change, à longueur constante: écriture
+            # positionnée directe (pwrite), sans troncature
+            os.pwrite(fd, new_bytes, offset)
+        else:
+            # Réécrit la fin du fichier en une seule écriture positionnée
+            payload = "".join(new_lines[i:]).encode()
+            os.pwrite(fd, payload, offset)
+            os.ftruncate(fd, offset + len(payload))
+    finally:
+        if fd is not store.fd:
+            os.close(fd)
 
 
-def add(details, filename, tasks, labels = None, status = "suspended"):
+def add(store, details, labels = None, status = "suspended"):
     """
     Commande CLI pour ajouter une nouvelle tâche.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         details (str): Description de la nouvelle tâche
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         labels (list[str], optional): Etiquette(s) de la nouvelle tâche, None si aucune
         status (str, optional): Statut initial de la tâche (défaut: "suspended")
         
     Side Effects:
-        - Ajoute une ligne au fichier spécifié et à l'historique
+        - Ajoute une ligne au fichier du store et à l'historique
         - Affiche un message de confirmation avec l'ID assigné
         - Peut demander interactivement à l'utilisateur de définir une dépendance
     """
 
-    # Utilise la logique métier pour créer la nouvelle tâche
-    result = core.add(tasks, details, labels, status)
-    
-    # Si l'utilisateur a annulé (Ctrl+C), on arrête tout pour éviter le crash
-    if result[0] is None:
-        return
+    filename = store.filename
+
+    # Vérification du statut (messages historiques conservés)
+    if status not in ["started", "suspended", "completed", "cancelled"]:
+        print(f"Statut '{status}' invalide, utilisation de 'suspended' à la place.")
+        status = "suspended"
+    print(f"Statut de la nouvelle tâche : {status}")
+
+    # Choix interactif de la dépendance, seulement s'il existe déjà des
+    # tâches; core.add reste pur (utilisable en lot, sans blocage sur stdin)
+    id_dep = None
+    parsed_tasks = store.parsed
+    if parsed_tasks:
+        try:
+            dependence = input("Cette tâche dépend t-elle d'une autre tâche ? O/N : ")
+            while dependence.lower() not in ["o", "n", "oui", "non"]:
+                dependence = input("Input invalide, cette tâche dépend t-elle d'une autre tâche ? O/N : ")
+
+            if dependence.lower() in ["oui", "o"]:
+                print("Liste des tâches existantes :")
+                # La passe d'affichage construit l'index {id: statut}: la
+                # validation et la recherche du parent deviennent des accès
+                # au dict plutôt que de nouveaux balayages de la liste
+                status_by_id = {}
+                for (tid, desc, _, state, _) in parsed_tasks:
+                    print(f"{tid}: {desc} ({state})")
+                    status_by_id[tid] = state
+
+                while True:
+                    try:
+                        id_dep = int(input("Laquelle ? "))
+                        if id_dep in status_by_id:
+                            if status == "started" or status == "completed":
+                                # Statut de la tâche dépendante en O(1)
+                                parent_status = status_by_id[id_dep]
+
+                                if parent_status != "completed":
+                                    print(f"La tâche dépendante n'est pas complétée (statut actuel : {parent_status}). La nouvelle tâche sera mise en 'suspended'.")
+                                    status = "suspended"
+                            break
+                        else:
+                            print(f"Cette tâche n'existe pas, entrez un identifiant valide")
+                    except ValueError:
+                        print("Erreur : veuillez entrer un nombre valide")
+        except KeyboardInterrupt:
+            # L'utilisateur a annulé (Ctrl+C): on arrête tout pour éviter le crash
+            print("\nOpération annulée")
+            return
 
-    task_id, description, labels_list, task_line = result
+    # Utilise la logique métier (pure) pour créer la nouvelle tâche
+    task_id, description, labels_list, task_line = core.add(store.lines, details, labels, status, id_dep, filename)
 
-    with open("historique.txt", "a") as h:
-        h.write(f"[This task was added at {get_current_datetime()}] {task_line}")
+    _history_write(f"[This task was added at {get_current_datetime()}] {task_line}")
     
-    # Ajoute la tâche au fichier (mode append)
-    with open(filename, 'a') as f:
-        f.write(task_line)
+    # Ajoute la tâche au fichier (mode append), via le descripteur du store
+    # quand il existe (fichier tout juste créé sinon)
+    if store.fd is not None:
+        os.lseek(store.fd, 0, os.SEEK_END)
+        os.write(store.fd, task_line.encode())
+    else:
+        _append_line(filename, task_line)
+    store.append_line(task_line)
     
     # Gestion des étiquettes
     labels_str = ",".join(labels_list) if labels_list else "None"
@@ -56,69 +254,63 @@ def add(details, filename, tasks, labels = None, status = "suspended"):
     # Confirmation à l'utilisateur
     print(f"Successfully added task {task_id} ({description}: {labels_str})")
 
-def modify(task_id, filename, tasks, new_details = None, new_status = None):
+def modify(store, task_id, new_details = None, new_status = None):
     """
     Commande CLI pour modifier une tâche existante.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à modifier
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         new_details (str, optional): Nouvelle description pour la tâche
         new_status (str, optional): Nouveau statut pour la tâche
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - N'écrit dans le fichier que les octets réellement modifiés
         - Enregistre les modifications dans l'historique
         - Affiche un message de succès ou d'erreur
         
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
+        Seuls les octets modifiés sont écrits: ligne patchée en place à
+        longueur constante, fin de fichier réécrite sinon (voir _write_back);
+        la réécriture complète atomique ne sert que si la première ligne
+        diffère déjà.
     """
 
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    filename = store.filename
+
     # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks, old_task = core.modify(tasks, task_id, new_details, new_status)
+    found, new_lines, old_task, new_task = core.modify(store.lines, tid_int, new_details, new_status, filename)
     
     if found:
-        # Vérifie la tâche modifiée pour l'affichage
-        new_task = None
-        for t in updated_tasks:
-            if t[0] == old_task[0]:
-                new_task = t
-                break
-
         if new_task == old_task:
             print("Aucune modification apportée à la tâche.")
             return
         
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+        # Réécrit uniquement ce qui a changé dans le fichier
+        _write_back(store, new_lines)
+        store.apply_lines(new_lines, old_task[0], new_task)
         print(f"Task {task_id} modified.")
 
         # Enregistre les modifications dans l'historique
-        with open("historique.txt", 'a') as h:
-            tid, desc, lab, status, dep = old_task
-            labels_str = ",".join(lab) if lab else "None" 
-            dep = dep if dep else "None"
-            h.write(f"[The description of this task was modified at {get_current_datetime()}] {tid};{desc};{labels_str};{status};{dep}\n")
+        _history_write(f"[The description of this task was modified at {get_current_datetime()}] {core.format_line(*old_task)}")
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def rm(task_id, filename, tasks):
+def rm(store, task_id):
     """
     Commande CLI pour supprimer une tâche.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à supprimer
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
         - Réécrit le fichier sans la tâche supprimée
@@ -128,48 +320,53 @@ def rm(task_id, filename, tasks):
         Les IDs des autres tâches ne sont pas modifiés après suppression.
     """
 
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    filename = store.filename
+
     # Utilise la logique métier pour supprimer la tâche
-    found, remaining_tasks, old_task = core.rm(tasks, task_id)
+    found, new_lines, old_task, changed_tasks = core.rm(store.lines, tid_int, filename)
     
     if found:
-        # Réécrit le fichier avec les tâches restantes
-        with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in remaining_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+        # Réécrit le fichier à partir de la ligne supprimée seulement
+        _write_back(store, new_lines)
+        store.lines = new_lines
+        # Répercute dans le cache les dépendances effacées puis la suppression
+        for changed in changed_tasks:
+            core.update_cached_task(filename, changed[0], changed)
+        core.update_cached_task(filename, tid_int, None)
         print(f"Task {task_id} removed.")
 
-        with open("historique.txt", 'a') as h:
-            tid, desc, lab, status, dep = old_task
-            labels_str = ",".join(lab) if lab else "None" 
-            dep = dep if dep else "None"
-            h.write(f"[This task was removed at {get_current_datetime()}] {tid};{desc};{labels_str};{status};{dep}\n")
+        _history_write(f"[This task was removed at {get_current_datetime()}] {core.format_line(*old_task)}")
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def add_options(task_id, filename, tasks, new_labels = None, id_dep = None):
+def add_options(store, task_id, new_labels = None, id_dep = None):
     """
     Commande CLI pour ajouter des options à une tâche existante (étiquettes ou dépendance).
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à modifier
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         new_labels (list[str], optional): Étiquette(s) à ajouter à la tâche
         id_dep (int, optional): ID de la tâche dont dépend la tâche cible
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - N'écrit dans le fichier que les octets réellement modifiés
         - Enregistre les modifications dans l'historique
         - Affiche un message de succès ou d'erreur
         
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
-        Les doublons d'étiquettes sont automatiquement évités.
+        Seuls les octets modifiés sont écrits: ligne patchée en place à
+        longueur constante, fin de fichier réécrite sinon (voir _write_back);
+        la réécriture complète atomique ne sert que si la première ligne
+        diffère déjà. Les doublons d'étiquettes sont automatiquement évités.
     """
 
     # Convertit la chaîne d'étiquettes en liste si c'est une chaîne
@@ -178,166 +375,215 @@ def add_options(task_id, filename, tasks, new_labels = None, id_dep = None):
     else:
         labels_list = new_labels if new_labels else []
 
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    filename = store.filename
+
     # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks, old_task = core.add_options(tasks, task_id, labels_list, id_dep)
+    found, new_lines, old_task, new_task = core.add_options(store.lines, tid_int, labels_list, id_dep, filename)
     
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, lab, state, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{state};{dep}\n")
+        # Requête idempotente (rien n'a changé): ni écriture ni historique
+        if new_task == old_task:
+            print("Aucune modification apportée à la tâche.")
+            return
+
+        # Réécrit uniquement ce qui a changé dans le fichier
+        _write_back(store, new_lines)
+        store.apply_lines(new_lines, old_task[0], new_task)
         print(f"Options added successfully.")
 
-        with open("historique.txt", 'a') as h:
-            tid, desc, lab, state, dep = old_task
-            labels_str = ",".join(lab) if lab else "None" 
-            dep = dep if dep else "None"
-            h.write(f"[A label was added to this task at {get_current_datetime()}] {tid};{desc};{labels_str};{state};{dep}\n")
+        _history_write(f"[A label was added to this task at {get_current_datetime()}] {core.format_line(*old_task)}")
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def rmLabel(task_id, filename, tasks):
+def rmLabel(store, task_id):
     """
     Commande CLI pour supprimer une étiquette d'une tâche existante.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à modifier
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - N'écrit dans le fichier que les octets réellement modifiés
         - Affiche un message de succès ou d'erreur
         
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
+        Seuls les octets modifiés sont écrits: ligne patchée en place à
+        longueur constante, fin de fichier réécrite sinon (voir _write_back);
+        la réécriture complète atomique ne sert que si la première ligne
+        diffère déjà.
     """
 
-    # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks, old_task = core.rmLabel(tasks, task_id)
-    
-    if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes
-                labels_str = ",".join(lab) if lab else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
-        print(f"Label removed successfully.")
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
 
-        old_id, old_desc, old_lab, old_status, old_dep = old_task
-        if old_lab: 
-            labels_str = ",".join(old_lab)
-        else:
-            labels_str = "None"
+    filename = store.filename
+
+    # Récupère les étiquettes de la tâche pour le choix interactif
+    labels = core.list_labels(store.lines, tid_int, filename)
+    if labels is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    if not labels:
+        print("Cette tâche n'a pas d'étiquettes à supprimer")
+        print("Aucune modification apportée à la tâche.")
+        return
+
+    print("Étiquettes de la tâche :")
+    for j, label in enumerate(labels):
+        print(f"{j}: {label}")
+
+    # Validation robuste de l'entrée utilisateur
+    while True:
+        try:
+            n = int(input("Entrez le numéro de l'étiquette à supprimer : "))
+            if 0 <= n < len(labels):
+                break
+            else:
+                print(f"Le numéro doit être entre 0 et {len(labels)-1}")
+        except ValueError:
+            print("Erreur : veuillez entrer un nombre valide")
+        except KeyboardInterrupt:
+            print("\nOpération annulée")
+            return
 
-        old_dep = old_dep if old_dep else "None"
+    # Utilise la logique métier (pure) pour retirer l'étiquette choisie
+    found, new_lines, old_task, new_task = core.rmLabel(store.lines, tid_int, n, filename)
 
-        with open("historique.txt", 'a') as h:
-            h.write(f"[A label was removed from this task at {get_current_datetime()}] {old_id};{old_desc};{labels_str};{old_status};{old_dep}\n")
+    if found:
+        # Requête idempotente (rien n'a changé): ni écriture ni historique
+        if new_task == old_task:
+            print("Aucune modification apportée à la tâche.")
+            return
+
+        # Réécrit uniquement ce qui a changé dans le fichier
+        _write_back(store, new_lines)
+        store.apply_lines(new_lines, old_task[0], new_task)
+        print(f"Label removed successfully.")
+
+        _history_write(f"[A label was removed from this task at {get_current_datetime()}] {core.format_line(*old_task)}")
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def clearLabel(task_id, filename, tasks):
+def clearLabel(store, task_id):
     """
     Commande CLI pour supprimer toutes les étiquettes d'une tâche existante.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à modifier
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - N'écrit dans le fichier que les octets réellement modifiés
         - Affiche un message de succès ou d'erreur
         
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
+        Seuls les octets modifiés sont écrits: ligne patchée en place à
+        longueur constante, fin de fichier réécrite sinon (voir _write_back);
+        la réécriture complète atomique ne sert que si la première ligne
+        diffère déjà.
     """
     
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    filename = store.filename
+
     # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks, old_task = core.clearLabel(tasks, task_id)
-    
+    found, new_lines, old_task, new_task = core.clearLabel(store.lines, tid_int, filename)
+
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, lab, status, dep in updated_tasks:
-                # Gestion des étiquettes et des dépendances
-                labels_str = ",".join(lab) if lab else "None"
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{status};{dep}\n")
+        # Requête idempotente (rien n'a changé): ni écriture ni historique
+        if new_task == old_task:
+            print("Aucune modification apportée à la tâche.")
+            return
+
+        # Réécrit uniquement ce qui a changé dans le fichier
+        _write_back(store, new_lines)
+        store.apply_lines(new_lines, old_task[0], new_task)
         print(f"All labels removed successfully.")
 
-        with open("historique.txt", 'a') as h:
-            tid, desc, lab, status, dep = old_task
-            labels_str = ",".join(lab) if lab else "None" 
-            dep = dep if dep else "None"
-            h.write(f"[All labels of this task were removed at {get_current_datetime()}] {tid};{desc};{labels_str};{status};{dep}\n")
+        _history_write(f"[All labels of this task were removed at {get_current_datetime()}] {core.format_line(*old_task)}")
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
-def rmDep(task_id, filename, tasks):
+def rmDep(store, task_id):
     """
     Commande CLI pour supprimer une dépendance à une tâche existante.
     
     Args:
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         task_id (str): ID de la tâche à modifier
-        filename (str): Chemin vers le fichier de tâches
-        tasks (list): Liste des lignes existantes du fichier
         
     Side Effects:
-        - Réécrit entièrement le fichier avec les modifications
+        - N'écrit dans le fichier que les octets réellement modifiés
         - Affiche un message de succès ou d'erreur
         
     Note:
-        Le fichier est entièrement réécrit pour maintenir la cohérence.
+        Seuls les octets modifiés sont écrits: ligne patchée en place à
+        longueur constante, fin de fichier réécrite sinon (voir _write_back);
+        la réécriture complète atomique ne sert que si la première ligne
+        diffère déjà.
     """
 
+    # Validation unique de l'ID à la frontière CLI: core reçoit un int
+    tid_int = _parse_id(task_id)
+    if tid_int is None:
+        print(f"Error: task id {task_id} not found.")
+        return
+
+    filename = store.filename
+
     # Utilise la logique métier pour modifier la tâche
-    found, updated_tasks, old_task = core.rmDep(tasks, task_id)
+    found, new_lines, old_task, new_task = core.rmDep(store.lines, tid_int, filename)
 
     if found:
-        # Réécrit tout le fichier avec les tâches mises à jour
-        with open(filename, 'w') as f:
-            for tid, desc, lab, state, dep in updated_tasks:
-                # Gestion des étiquettes
-                labels_str = ",".join(lab) if lab else "None"
-                # Gestion de la dépendance
-                dep = dep if dep else "None"
-                f.write(f"{tid};{desc};{labels_str};{state};{dep}\n")
+        # Requête idempotente (rien n'a changé): ni écriture ni historique
+        if new_task == old_task:
+            print("Aucune modification apportée à la tâche.")
+            return
 
-        print("Dependence removed successfully.")
+        # Réécrit uniquement ce qui a changé dans le fichier
+        _write_back(store, new_lines)
+        store.apply_lines(new_lines, old_task[0], new_task)
 
-        old_id, old_desc, old_lab, old_state, old_dep = old_task
-        labels_str = ",".join(old_lab) if old_lab else "None"
-        old_dep = old_dep if old_dep else "None"
+        print("Dependence removed successfully.")
 
-        with open("historique.txt", 'a') as h:
-            h.write(
-                f"[A dependence was removed from this task at {get_current_datetime()}] "
-                f"{old_id};{old_desc};{labels_str};{old_state};{old_dep}\n"
-            )
+        _history_write(
+            f"[A dependence was removed from this task at {get_current_datetime()}] "
+            f"{core.format_line(*old_task)}"
+        )
 
     else:
         # Message d'erreur si la tâche n'existe pas
         print(f"Error: task id {task_id} not found.")
 
 
-def show(tasks):
+def show(store):
     """
     Commande CLI pour afficher toutes les tâches.
     
     Args:
-        tasks (list): Liste des lignes du fichier de tâches
+        store (core.TaskStore): Fichier de tâches ouvert pour l'invocation
         
     Side Effects:
         - Affiche un tableau formaté des tâches sur stdout
@@ -347,4 +593,4 @@ def show(tasks):
         Délègue l'affichage au module core qui gère le formatage du tableau.
     """
     # Délègue l'affichage au module core
-    core.show(tasks)
\ No newline at end of file
+    core.show(store.lines, store.filename)
\ No newline at end of file
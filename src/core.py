@@ -5,18 +5,419 @@ Ce module contient la logique métier principale pour la gestion des tâches.
 Il fournit les fonctions de base pour créer, modifier, supprimer et afficher des tâches.
 
 Format des tâches: Chaque tâche est stockée sous forme "ID;Description;étiquette1,étiquette2" 
-ou "ID;Description;None" (pour les tâches sans étiquettes) dans le fichier.
+ou "ID;Description;" (champ vide pour les tâches sans étiquettes) dans le fichier.
 
-Rétrocompatibilité: Supporte aussi l'ancien format "ID;Description" (sans étiquettes).
+Rétrocompatibilité: Supporte aussi l'ancien format "ID;Description" (sans étiquettes)
+et l'ancien marqueur "None" pour un champ d'étiquettes vide.
 """
 
+import os
+import re
+import sys
+
+# Cache des fichiers déjà analysés:
+#   filename -> (mtime_ns, size, parsed_tasks, max_id, index_by_id)
+# Évite de re-découper toutes les lignes quand le fichier n'a pas changé
+# entre deux commandes (invocations scriptées, suite de tests...), garde
+# l'ID maximum sous la main pour add() et un index {id: position} pour
+# retrouver une tâche en O(1) au lieu d'un balayage linéaire.
+_task_cache = {}
+
+# Nombre de fichiers gardés en cache: un processus ne travaille en pratique
+# que sur un ou deux fichiers, on borne pour éviter toute croissance sans fin
+_TASK_CACHE_MAX = 4
+
+
+def _cache_store(filename, entry):
+    """Insère une entrée dans le cache en évinçant la plus ancienne au besoin."""
+    _task_cache.pop(filename, None)
+    if len(_task_cache) >= _TASK_CACHE_MAX:
+        # Les dicts préservent l'ordre d'insertion: le premier est le plus ancien
+        _task_cache.pop(next(iter(_task_cache)))
+    _task_cache[filename] = entry
+
+# Statuts internés: quatre valeurs possibles, partagées entre toutes les
+# tâches analysées — les comparaisons d'égalité se réduisent à un test de
+# pointeur et chaque liste ne retient qu'une référence par statut
+_STATUS = {s: sys.intern(s) for s in ("started", "suspended", "completed", "cancelled")}
+
+# Étiquettes d'une ligne éditée à la main ("a, b", champs vides...):
+# une seule passe de regex qui rogne les espaces et saute les segments
+# vides, au lieu du triple passage split + strip par étiquette + filtre
+_LABEL_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+# Gabarit de ligne pré-construit: le formatage % simple (%d/%s) passe par une
+# seule routine C, là où une f-string recompose la ligne champ par champ
+_LINE_FMT = "%d;%s;%s;%s;%s\n"
+
+
+def parse_tasks_cached(filename, tasks):
+    """
+    Version avec cache de parse_tasks, indexée sur (mtime_ns, taille) du fichier.
+
+    Args:
+        filename (str|None): Chemin du fichier de tâches, None pour désactiver le cache
+        tasks (list): Liste des lignes lues depuis le fichier de tâches
+
+    Returns:
+        list: Même résultat que parse_tasks(tasks)
+
+    Note:
+        - Si le fichier n'a pas changé depuis le dernier appel (même mtime_ns
+          et même taille), la liste déjà analysée est retournée directement
+        - Les écritures doivent passer par update_cache/append_cached pour que
+          le cache reste cohérent sans re-analyse (write-through)
+        - Retombe sur parse_tasks si filename est None ou si stat échoue
+    """
+
+    if filename is None:
+        return parse_tasks(tasks)
+
+    try:
+        st = os.stat(filename)
+    except OSError:
+        # Fichier inaccessible: pas de cache possible
+        return parse_tasks(tasks)
+
+    # Cache valide si le fichier n'a pas bougé depuis la dernière analyse
+    entry = _task_cache.get(filename)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    parsed_tasks = parse_tasks(tasks)
+    max_id = max((task[0] for task in parsed_tasks), default=0)
+    index_by_id = {task[0]: i for i, task in enumerate(parsed_tasks)}
+    _cache_store(filename, (st.st_mtime_ns, st.st_size, parsed_tasks, max_id, index_by_id))
+    return parsed_tasks
+
+
+def update_cache(filename, parsed_tasks, max_id=None, index_by_id=None):
+    """
+    Met à jour le cache après une réécriture du fichier (write-through).
+
+    Args:
+        filename (str): Chemin du fichier de tâches qui vient d'être écrit
+        parsed_tasks (list): Liste des tâches telles qu'écrites dans le fichier
+        max_id (int, optional): ID maximum déjà connu, recalculé si omis
+        index_by_id (dict, optional): Index {id: position} déjà connu,
+            reconstruit si omis
+
+    Note:
+        À appeler juste après l'écriture pour que la prochaine lecture
+        retrouve la liste déjà analysée sans repasser par parse_tasks.
+    """
+
+    try:
+        st = os.stat(filename)
+    except OSError:
+        # Écriture douteuse: on invalide plutôt que de garder un cache faux
+        _task_cache.pop(filename, None)
+        return
+    if max_id is None:
+        max_id = max((task[0] for task in parsed_tasks), default=0)
+    if index_by_id is None:
+        index_by_id = {task[0]: i for i, task in enumerate(parsed_tasks)}
+    _cache_store(filename, (st.st_mtime_ns, st.st_size, parsed_tasks, max_id, index_by_id))
+
+
+def append_cached(filename, task_line):
+    """
+    Ajoute une ligne au cache après un ajout en fin de fichier (write-through).
+
+    Args:
+        filename (str): Chemin du fichier de tâches qui vient d'être complété
+        task_line (str): La ligne qui vient d'être ajoutée au fichier
+
+    Note:
+        - Seule la nouvelle ligne est analysée; si le fichier n'était pas
+          encore dans le cache, la prochaine lecture fera l'analyse complète
+        - L'entrée a forcément été validée (mtime+taille) par le chemin de
+          lecture de la même commande — parse_tasks_cached dans add();
+          par sécurité, un ID déjà présent dans l'index trahit une entrée
+          périmée et provoque son éviction plutôt qu'un réestampillage
+    """
+
+    entry = _task_cache.get(filename)
+    if entry is None:
+        return
+    new_tasks = parse_tasks([task_line])
+    index_by_id = entry[4]
+    if new_tasks and new_tasks[0][0] in index_by_id:
+        # Entrée périmée (l'ID "nouveau" y figure déjà): éviction
+        _task_cache.pop(filename, None)
+        return
+    new_max = max(entry[3], new_tasks[0][0]) if new_tasks else entry[3]
+    if new_tasks:
+        index_by_id[new_tasks[0][0]] = len(entry[2])
+    update_cache(filename, entry[2] + new_tasks, new_max, index_by_id)
+
+
+def _iter_mapped_lines(fileno):
+    """Découpe en lignes la projection mmap du descripteur donné."""
+
+    # Import paresseux: seul ce lecteur utilise mmap
+    import mmap
+
+    try:
+        mm = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Fichier vide: rien à projeter
+        return
+    try:
+        start = 0
+        size = len(mm)
+        while start < size:
+            end = mm.find(b"\n", start)
+            if end == -1:
+                yield mm[start:].decode()
+                break
+            yield mm[start:end + 1].decode()
+            start = end + 1
+    finally:
+        mm.close()
+
+
+def iter_task_lines(filename, fd=None):
+    """
+    Itère sur les lignes du fichier de tâches via une projection mmap.
+
+    Args:
+        filename (str): Chemin du fichier de tâches
+        fd (int, optional): Descripteur déjà ouvert à réutiliser (celui du
+            TaskStore); si omis, le fichier est ouvert le temps de la lecture
+
+    Yields:
+        str: Chaque ligne du fichier, saut de ligne final inclus (même
+        découpage que readlines)
+
+    Note:
+        - Le fichier est projeté en lecture seule et découpé à la volée:
+          pas de copie intermédiaire de tout le contenu avant découpage,
+          et le décodage se fait ligne par ligne
+        - Un fichier vide ne produit aucune ligne (mmap refuse une
+          projection de taille nulle)
+        - parse_tasks accepte indifféremment une liste ou cet itérateur
+    """
+
+    if fd is not None:
+        yield from _iter_mapped_lines(fd)
+        return
+
+    with open(filename, 'rb') as f:
+        yield from _iter_mapped_lines(f.fileno())
+
+
+class TaskStore:
+    """
+    État partagé d'un fichier de tâches pour la durée d'un processus.
+
+    Lit le fichier une seule fois à la construction puis sert de point
+    d'accès commun aux commandes: chemin, lignes brutes et liste analysée
+    (servie par le cache d'analyse, qui garde aussi l'ID maximum). Les
+    commandes tiennent les lignes à jour après chaque écriture, si bien
+    qu'une suite de commandes dans le même processus (scripts, tests,
+    futur REPL) ne relit jamais le fichier.
+
+    Attributes:
+        filename (str): Chemin du fichier de tâches
+        lines (list): Lignes brutes du fichier, maintenues après chaque écriture
+        fd (int|None): Descripteur lecture/écriture ouvert une seule fois et
+            partagé entre la lecture initiale et les écritures (None pour un
+            store construit sur des lignes fournies, ex. affichage ou
+            fichier encore inexistant)
+    """
+
+    def __init__(self, filename, lines=None):
+        """
+        Args:
+            filename (str): Chemin du fichier de tâches
+            lines (list, optional): Lignes déjà lues; si omis, le fichier est
+                ouvert une seule fois en lecture/écriture — descripteur
+                conservé pour les écritures — et lu (FileNotFoundError est
+                propagée pour que l'appelant décide, comme avant, quoi faire
+                d'un fichier absent)
+        """
+        self.filename = filename
+        self.fd = None
+        if lines is None:
+            # Un seul open pour toute la vie de la commande: la lecture mmap
+            # et les écritures en place réutilisent ce descripteur
+            self.fd = os.open(filename, os.O_RDWR)
+            lines = list(iter_task_lines(filename, self.fd))
+        self.lines = lines
+
+    def reopen(self):
+        """Rouvre le descripteur après un remplacement atomique du fichier."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = os.open(self.filename, os.O_RDWR)
+
+    @property
+    def parsed(self):
+        """Liste analysée des tâches, servie par le cache d'analyse."""
+        return parse_tasks_cached(self.filename, self.lines)
+
+    def apply_lines(self, new_lines, task_id, new_task):
+        """
+        Prend acte d'une écriture qui n'a resérialisé qu'une ligne.
+
+        Args:
+            new_lines (list): Lignes du fichier telles qu'écrites
+            task_id (int): ID de la tâche touchée
+            new_task (tuple|None): Nouveau tuple de la tâche, None si supprimée
+
+        Note:
+            À appeler après l'écriture: remplace les lignes en mémoire et
+            répercute la seule tâche modifiée dans le cache d'analyse.
+        """
+        self.lines = new_lines
+        update_cached_task(self.filename, task_id, new_task)
+
+    def append_line(self, task_line):
+        """
+        Prend acte d'un ajout en fin de fichier (ligne déjà écrite).
+
+        Note:
+            Complète les lignes en mémoire et le cache d'analyse avec la
+            seule nouvelle ligne, sans réanalyse du reste.
+        """
+        self.lines.append(task_line)
+        append_cached(self.filename, task_line)
+
+
+def iter_parse_tasks(tasks):
+    """
+    Analyse les lignes brutes en tâches structurées, produites à la volée.
+
+    Args:
+        tasks (iterable): Lignes du fichier de tâches (liste ou itérateur,
+            typiquement iter_task_lines)
+
+    Yields:
+        tuple: (id, description, labels, status, dependence) par tâche valide
+
+    Note:
+        Version génératrice de parse_tasks: enchaînée sur iter_task_lines,
+        elle permet de consommer les tâches d'un gros fichier sans jamais
+        matérialiser de liste intermédiaire. Mêmes règles de tolérance que
+        parse_tasks (lignes vides ou mal formatées ignorées, anciens
+        formats acceptés). Le format est détecté sur la première ligne non
+        vide: un fichier écrit par l'outil (exactement 5 champs partout)
+        passe par l'analyseur spécialisé sans tests de longueur, les
+        lignes hors format retombant individuellement sur l'analyseur
+        tolérant.
+    """
+
+    parse_one = None
+    for line in tasks:
+        line = line.strip()
+        if not line:  # Ignore les lignes vides
+            continue
+
+        # Détection du format sur la première ligne non vide
+        if parse_one is None:
+            parse_one = _parse_5field if line.count(";") == 4 else _parse_legacy
+
+        task = parse_one(line)
+        if task is None and parse_one is _parse_5field:
+            # Ligne hors format courant au milieu du fichier: repli tolérant
+            task = _parse_legacy(line)
+        if task is not None:
+            yield task
+
+
+def _split_labels(labels_s):
+    """
+    Découpe un champ d'étiquettes, tolérant pour les fichiers édités à la main.
+
+    Le chemin rapide est un simple split(','): l'outil n'écrit jamais
+    de blancs autour des virgules. Un champ qui contient un blanc, quel
+    qu'il soit (édition manuelle), ou des segments vides passe par une
+    unique passe de regex qui rogne les blancs et ignore les segments
+    vides — même résultat que l'ancien strip-par-étiquette, en une passe
+    au lieu de trois.
+    """
+    if not labels_s or labels_s == "None":
+        return []
+    if (",," not in labels_s and labels_s[0] != "," and labels_s[-1] != ","
+            and not any(map(str.isspace, labels_s))):
+        return labels_s.split(",")
+    return _LABEL_RE.findall(labels_s)
+
+
+def _parse_5field(line):
+    """
+    Analyse une ligne au format courant, exactement 5 champs, sans branches.
+
+    Returns:
+        tuple|None: La tâche analysée, ou None si la ligne n'est pas au
+        format courant (l'appelant retombe alors sur _parse_legacy).
+    """
+
+    parts = line.split(";")
+    if len(parts) != 5:
+        return None
+    tid_s, description, labels_s, status, dep_s = parts
+    if not tid_s.isdecimal():
+        return None
+    labels = _split_labels(labels_s)
+    status = status.strip() or "suspended"
+    dep_s = dep_s.strip()
+    return (int(tid_s), description, labels, _STATUS.get(status, status),
+            int(dep_s) if dep_s.isdigit() else None)
+
+
+def _parse_legacy(line):
+    """
+    Analyse tolérante d'une ligne: champs manquants et anciens formats admis.
+
+    Returns:
+        tuple|None: La tâche analysée, ou None pour une ligne mal formée
+        (sans ';' ou avec un ID non numérique).
+    """
+
+    # Une seule passe C de découpe, limitée aux 5 champs du format,
+    # au lieu d'un appel de méthode par champ
+    parts = line.split(";", 4)
+    if len(parts) < 2:  # Au minimum ID et description
+        return None
+
+    # Prédicat plutôt qu'exception pour les IDs non numériques: les
+    # lignes mal formées ne paient plus la construction d'une ValueError
+    tid_s = parts[0].strip()
+    if not (tid_s.isdecimal() or (tid_s[:1] == "-" and tid_s[1:].isdecimal())):
+        # Ignore les lignes avec un ID non numérique
+        return None
+    tid = int(tid_s)
+
+    description = parts[1]
+
+    # Gestion des étiquettes (rétrocompatibilité: champ absent ou "None");
+    # l'écriture ne met jamais d'espaces autour des virgules, inutile de
+    # re-strip() chaque étiquette
+    labels_s = parts[2] if len(parts) > 2 else ""
+    labels = _split_labels(labels_s)
+
+    # Gestion statut
+    status = (parts[3].strip() if len(parts) > 3 else "") or "suspended"
+    status = _STATUS.get(status, status)
+
+    # Dépendances (tout champ excédentaire est ignoré, comme avant)
+    dep_s = parts[4].partition(";")[0].strip() if len(parts) > 4 else ""
+    if dep_s.isdigit():
+        dependence = int(dep_s)
+    else:
+        dependence = None
+
+    return (tid, description, labels, status, dependence)
+
 
 def parse_tasks(tasks):
     """
     Parse les lignes brutes du fichier en une liste structurée de tâches.
     
     Args:
-        tasks (list): Liste des lignes lues depuis le fichier de tâches
+        tasks (iterable): Lignes lues depuis le fichier de tâches
         
     Returns:
         list: Liste de tuples (id: int, description: str, labels: list[str], status: str, dependence: int|None) 
@@ -27,79 +428,176 @@ def parse_tasks(tasks):
         - Ignore les lignes mal formatées (sans ';' ou avec ID non numérique)
         - Le format attendu est "ID;Description;Labels;Status;Dependence"
         - Gère la rétrocompatibilité avec les anciens formats
+        - Simple matérialisation de iter_parse_tasks, pour les appelants
+          qui ont besoin de la liste complète (cache, réécritures)
         
     Exemple:
         >>> parse_tasks(["1;Faire les courses;None;suspended;None", "2;Réviser;Urgent;started;1"])
         [(1, 'Faire les courses', [], 'suspended', None), (2, 'Réviser', ['Urgent'], 'started', 1)]
     """
-    
-    parsed_tasks = []
-    for line in tasks:
-        line = line.strip()
-        if line:  # Ignore les lignes vides
-            parts = line.split(";")
-            if len(parts) >= 2:  # Au minimum ID et description
-                try:
-                    tid = int(parts[0])
-                    description = parts[1]
-                    # Gestion des étiquettes (rétrocompatibilité)
-                    if len(parts) >= 3 and parts[2] != "None":
-                        labels = [label.strip() for label in parts[2].split(",") if label.strip()]
-                    else:
-                        labels = []
-
-                    # Gestion statut
-                    if len(parts) >= 4 and parts[3].strip():
-                        status = parts[3].strip()
-                    else:
-                        status = "suspended"
-
-                    # Dépendances
-                    if len(parts) >= 5 and parts[4].strip().isdigit():
-                        dependence = int(parts[4].strip())
-                    else:
-                        dependence = None
-                    
-                    parsed_tasks.append((tid, description, labels, status, dependence))
-                except ValueError:
-                    # Ignore les lignes avec un ID non numérique
-                    continue
 
-    return parsed_tasks
+    return list(iter_parse_tasks(tasks))
+
+
+def format_line(tid, desc, labels, status, dep):
+    """
+    Formate une tâche en ligne de fichier, saut de ligne final inclus.
+
+    Args:
+        tid (int): ID de la tâche
+        desc (str): Description de la tâche
+        labels (list[str]): Étiquettes, liste vide si aucune
+        status (str): Statut de la tâche
+        dep (int|None): ID de la dépendance, None si aucune
+
+    Returns:
+        str: La ligne au format ID;Description;Labels;Status;Dependence
+
+    Note:
+        Pendant de parse_tasks et point de passage unique de la
+        sérialisation: toute évolution du format (ou un éventuel portage
+        compilé de l'analyse/sérialisation) se fait ici et dans
+        parse_tasks, sans toucher au reste du code.
+    """
+
+    return _LINE_FMT % (tid, desc, ",".join(labels), status, dep if dep else "None")
+
 
+def _find_line(tasks, task_id, filename=None):
+    """
+    Localise la ligne d'une tâche par son ID sans analyser tout le fichier.
+
+    Args:
+        tasks (list): Liste des lignes existantes du fichier de tâches
+        task_id (int): ID (déjà converti) de la tâche recherchée
+        filename (str, optional): Chemin du fichier, pour l'index du cache
+
+    Returns:
+        tuple: (line_index: int, task: tuple) ou (None, None) si absente
+            - line_index: Position de la ligne dans la liste tasks
+            - task: Le tuple (id, desc, labels, status, dep) de la tâche
+
+    Note:
+        - Si le cache est chaud, l'index {id: position} répond en O(1)
+          (applicable quand chaque ligne du fichier est une tâche valide,
+          seul cas où positions de ligne et d'analyse coïncident)
+        - L'entrée n'est utilisée qu'après la même validation mtime+taille
+          que parse_tasks_cached; une entrée périmée (édition externe du
+          fichier) est retirée du cache au passage, si bien que les
+          répercussions post-écriture ne peuvent pas la réestampiller
+        - Sinon, les lignes non concernées ne subissent qu'un test de
+          préfixe "ID;" : seule la ligne trouvée est analysée en entier
+    """
 
-def add(tasks, details, labels = None, status="suspended"):
+    # Chemin rapide: index du cache quand lignes et tâches coïncident 1:1.
+    # L'entrée n'est digne de confiance que si le fichier n'a pas changé
+    # depuis son analyse (même validation que parse_tasks_cached); sinon on
+    # l'évince tout de suite pour qu'elle ne soit pas resservie plus tard.
+    if filename is not None:
+        entry = _task_cache.get(filename)
+        if entry is not None:
+            try:
+                st = os.stat(filename)
+            except OSError:
+                st = None
+            if st is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                # Entrée périmée (édition externe): éviction immédiate
+                _task_cache.pop(filename, None)
+            elif len(entry[2]) == len(tasks):
+                i = entry[4].get(task_id)
+                if i is None:
+                    return None, None
+                return i, entry[2][i]
+
+    prefix = f"{task_id};"
+    for i, line in enumerate(tasks):
+        if line.lstrip().startswith(prefix):
+            parsed = parse_tasks([line])
+            if parsed and parsed[0][0] == task_id:
+                return i, parsed[0]
+    return None, None
+
+
+def update_cached_task(filename, task_id, new_task):
+    """
+    Répercute la modification d'une seule tâche dans le cache (write-through).
+
+    Args:
+        filename (str): Chemin du fichier de tâches qui vient d'être écrit
+        task_id (int): ID de la tâche modifiée
+        new_task (tuple|None): Nouveau tuple de la tâche, None si supprimée
+
+    Note:
+        - Sans effet si le fichier n'est pas dans le cache: la prochaine
+          lecture fera l'analyse complète
+        - L'entrée a forcément été validée (mtime+taille) par le chemin de
+          lecture de la même commande — _find_line évince toute entrée
+          périmée avant l'écriture; une tâche absente de l'index trahit
+          malgré tout une entrée périmée et provoque son éviction
+    """
+
+    entry = _task_cache.get(filename)
+    if entry is None:
+        return
+    parsed_tasks = entry[2]
+    i = entry[4].get(task_id)
+    if i is None:
+        # La tâche ne figure pas dans l'entrée: le cache est périmé (édition
+        # externe), on l'invalide plutôt que de le réestampiller tel quel
+        _task_cache.pop(filename, None)
+        return
+    if new_task is None:
+        del parsed_tasks[i]
+    else:
+        parsed_tasks[i] = new_task
+    if new_task is not None:
+        # Modification en place: l'ID maximum et l'index restent valables
+        update_cache(filename, parsed_tasks, entry[3], entry[4])
+    else:
+        # Une suppression peut retirer l'ID maximum et décale l'index
+        update_cache(filename, parsed_tasks)
+
+
+def add(tasks, details, labels = None, status="suspended", id_dep=None, filename=None):
     """
     Ajoute une nouvelle tâche avec un ID auto-incrémenté.
-    
+
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
         details (str): Description de la nouvelle tâche
         labels (list[str], optional): Liste d'étiquette(s) de la nouvelle tâche, None si aucune
-        status (str, optional): Statut initial de la tâche (défaut: "suspended")
-        
+        status (str, optional): Statut initial de la tâche, déjà validé par
+            l'interface (défaut: "suspended")
+        id_dep (int, optional): ID de la tâche dont dépend la nouvelle tâche,
+            choisi en amont (commands.add gère le dialogue), None si aucune
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
+
     Returns:
-        tuple: (new_id: int, description: str, labels: list, task_line: str) ou (None, None, None, None) si annulé
+        tuple: (new_id: int, description: str, labels: list, task_line: str)
             - new_id: L'ID assigné à la nouvelle tâche
             - description: La description de la tâche
             - labels: Liste des étiquettes, vide si aucune
             - task_line: La ligne formatée à écrire dans le fichier (format: ID;Description;Labels;Status;Dependence)
-            
+
     Note:
-        - L'ID est calculé comme max(IDs existants) + 1
+        - L'ID est calculé comme max(IDs existants) + 1 (O(1) via le cache)
         - Si aucune tâche n'existe, l'ID commence à 1
-        - L'utilisateur peut définir une dépendance de manière interactive
         - La ligne retournée inclut le saut de ligne final
-        - Retourne (None, None, None, None) si l'utilisateur annule (Ctrl+C)
-        
+        - Fonction pure (ni input() ni print()): utilisable en lot pour
+          ajouter des tâches en série sans blocage sur stdin
+
     Example:
         >>> add(["1;Tâche existante;None;completed;None"], "Nouvelle tâche", ["urgent"], "suspended")
         (2, 'Nouvelle tâche', ['urgent'], '2;Nouvelle tâche;urgent;suspended;None\n')
     """
 
-    # Trouve le prochain ID disponible en analysant les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    if parsed_tasks:
+    # Trouve le prochain ID disponible: l'ID maximum est tenu à jour dans le
+    # cache, le balayage max() ne sert que si le fichier n'est pas en cache
+    parsed_tasks = parse_tasks_cached(filename, tasks)
+    entry = _task_cache.get(filename) if filename is not None else None
+    if entry is not None:
+        new_id = entry[3] + 1
+    elif parsed_tasks:
         # Calcule l'ID maximum et ajoute 1
         new_id = max(task[0] for task in parsed_tasks) + 1
     else:
@@ -111,437 +609,349 @@ def add(tasks, details, labels = None, status="suspended"):
         labels_list = []
     else:
         labels_list = labels
-    
-    labels_str = ",".join(labels_list) if labels_list else "None"
-    
-    # Vérification du statut
-    if status not in ["started", "suspended", "completed", "cancelled"]:
-        print(f"Statut '{status}' invalide, utilisation de 'suspended' à la place.")
-        status = "suspended"
-    print(f"Statut de la nouvelle tâche : {status}")
-
-    # Gestion des dépendances
-    id_dep = None
-    if parsed_tasks:
-        try:
-            dependence = input("Cette tâche dépend t-elle d'une autre tâche ? O/N : ")
-            while dependence.lower() not in ["o", "n", "oui", "non"]:
-                dependence = input("Input invalide, cette tâche dépend t-elle d'une autre tâche ? O/N : ")
-
-            if dependence.lower() in ["oui", "o"]:
-                print("Liste des tâches existantes :")
-                id_list = []
-                for (tid, desc, _, state, _) in parsed_tasks:
-                    print(f"{tid}: {desc} ({state})")
-                    id_list.append(tid)
-
-                while True:
-                    try:
-                        id_dep = int(input("Laquelle ? "))
-                        if id_dep in id_list:
-                            if status == "started" or status == "completed":
-                                # On cherche le statut de la tâche dépendante
-                                parent_status = "suspended"
-                                for (pid, _, _, pstate, _) in parsed_tasks:
-                                    if pid == id_dep:
-                                        parent_status = pstate
-                                        break
-                            
-                                if parent_status != "completed":
-                                    print(f"La tâche dépendante n'est pas complétée (statut actuel : {parent_status}). La nouvelle tâche sera mise en 'suspended'.")
-                                    status = "suspended"
-                            break
-                        else:
-                            print(f"Cette tâche n'existe pas, entrez un identifiant valide")
-                    except ValueError:
-                        print("Erreur : veuillez entrer un nombre valide")
-        except KeyboardInterrupt:
-            print("\nOpération annulée")
-            return None, None, None, None
-
-    # Formate la ligne pour l'écriture dans le fichier
-    new_task_line = f"{new_id};{details};{labels_str};{status};{id_dep}\n"
+
+    # Formate la ligne pour l'écriture dans le fichier (champ d'étiquettes
+    # vide, et non "None", quand il n'y en a pas)
+    new_task_line = _LINE_FMT % (new_id, details, ",".join(labels_list), status, id_dep)
     return (new_id, details, labels_list, new_task_line)
 
 
-def modify(tasks, task_id, new_details = None, new_status = None):
+def modify(tasks, task_id, new_details = None, new_status = None, filename=None):
     """
     Modifie la description et/ou le statut d'une tâche existante par son ID.
     
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à modifier
+        task_id (int): ID de la tâche à modifier (validé à la frontière CLI)
         new_details (str, optional): Nouvelle description pour la tâche
         new_status (str, optional): Nouveau statut pour la tâche (started, suspended, completed, cancelled)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
         
     Returns:
-        tuple: (found: bool, updated_tasks: list, old_task: tuple)
+        tuple: (found: bool, new_lines: list, old_task: tuple, new_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
-            - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
-            
+            - new_lines: Lignes du fichier après modification (seule la ligne
+              de la tâche est resérialisée, les autres restent telles quelles)
+            - old_task: Tuple (id, desc, lab, status, dep) avant modification
+            - new_task: Le même tuple après modification
+
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
-        - Si l'ID n'est pas numérique, retourne (False, [], None)
         - Vérifie les dépendances avant de permettre le passage au statut "started"
-        - La liste retournée contient toutes les tâches, modifiée incluse
-        
+        - Seule la ligne visée est analysée puis resérialisée: les autres
+          lignes ne subissent qu'un test de préfixe (voir _find_line)
+
     Example:
-        >>> modify(["1;Ancienne tâche;None;suspended;None"], "1", "Nouvelle description", "started")
-        (True, [(1, 'Nouvelle description', [], 'started', None)], (1, 'Ancienne tâche', [], 'suspended', None))
+        >>> modify(["1;Ancienne tâche;None;suspended;None"], 1, "Nouvelle description", "started")
+        (True, ['1;Nouvelle description;;started;None\\n'], (1, 'Ancienne tâche', [], 'suspended', None), (1, 'Nouvelle description', [], 'started', None))
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    old_task = None
-
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            # IMPORTANT : On sauvegarde l'ancienne tâche AVANT toute modification
-            old_task = (tid, desc, lab, state, dep)
-            
-            # 1. Mise à jour du statut avec vérification des dépendances
-            if new_status is not None:
-                # Si on essaie de DÉMARRER une tâche qui a une dépendance
-                if new_status == "started" and dep is not None:
-                    # On vérifie si la tâche parente est terminée
-                    parent_completed = False
-                    parent_exists = False
-
-                    for (pid, _, _, pstate, _) in parsed_tasks:
-                        if pid == dep:
-                            parent_exists = True
-                            if pstate == "completed":
-                                parent_completed = True
-                            break
-                    
-                    if parent_exists and not parent_completed:
-                        print(f"REFUSÉ : La tâche parente (ID {dep}) n'est pas terminée.")
-                        # On ne modifie pas 'state', il reste l'ancien
-                    else:
-                        state = new_status
-
-                # Si c'est un autre statut valide ou s'il n'y a pas de dépendance
-                elif new_status in ["started", "suspended", "completed", "cancelled"]:
-                    state = new_status
-                
-                else:
-                    print(f"Statut '{new_status}' invalide, pas de modification.")
-
-            # 2. Mise à jour de la description
-            if new_details is not None:
-                desc = new_details
-                
-            # On met à jour la ligne dans la liste
-            parsed_tasks[i] = (tid, desc, lab, state, dep)
-            found = True
-            break    
-    
-    return found, parsed_tasks, old_task
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, None
+
+    tid, desc, lab, state, dep = old_task
+
+    # 1. Mise à jour du statut avec vérification des dépendances
+    if new_status is not None:
+        # Si on essaie de DÉMARRER une tâche qui a une dépendance
+        if new_status == "started" and dep is not None:
+            # On vérifie si la tâche parente est terminée
+            _, parent_task = _find_line(tasks, dep, filename)
+
+            if parent_task is not None and parent_task[3] != "completed":
+                print(f"REFUSÉ : La tâche parente (ID {dep}) n'est pas terminée.")
+                # On ne modifie pas 'state', il reste l'ancien
+            else:
+                state = new_status
+
+        # Si c'est un autre statut valide ou s'il n'y a pas de dépendance
+        elif new_status in ["started", "suspended", "completed", "cancelled"]:
+            state = new_status
+
+        else:
+            print(f"Statut '{new_status}' invalide, pas de modification.")
+
+    # 2. Mise à jour de la description
+    if new_details is not None:
+        desc = new_details
+
+    # Seule la ligne modifiée est resérialisée
+    new_task = (tid, desc, lab, state, dep)
+    new_lines = tasks[:i] + [format_line(*new_task)] + tasks[i + 1:]
+
+    return True, new_lines, old_task, new_task
     
-def rm(tasks, task_id):
+def rm(tasks, task_id, filename=None):
     """
     Supprime une tâche par son ID et met à jour les dépendances.
     
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à supprimer
+        task_id (int): ID de la tâche à supprimer (validé à la frontière CLI)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
         
     Returns:
-        tuple: (found: bool, remaining_tasks: list, old_task: tuple)
+        tuple: (found: bool, new_lines: list, old_task: tuple, changed_tasks: list)
             - found: True si la tâche a été trouvée et supprimée, False sinon
-            - remaining_tasks: Liste des tâches restantes (tuples à 5 éléments)
+            - new_lines: Lignes du fichier après suppression (la ligne retirée
+              disparaît, seules les lignes des tâches qui dépendaient d'elle
+              sont resérialisées, les autres restent telles quelles)
             - old_task: Tuple (id, desc, lab, status, dep) correspondant à la tâche supprimée
-            
+            - changed_tasks: Tuples des tâches dont la dépendance a été retirée
+
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
-        - Si l'ID n'est pas numérique, retourne (False, tâches_originales, None)
         - Les IDs des autres tâches ne sont pas réassignés
         - Les dépendances vers la tâche supprimée sont automatiquement retirées
-        
+
     Example:
-        >>> rm(["1;Tâche 1;None;completed;None", "2;Tâche 2;None;suspended;1"], "1")
-        (True, [(2, 'Tâche 2', [], 'suspended', None)], (1, 'Tâche 1', [], 'completed', None))
+        >>> rm(["1;Tâche 1;None;completed;None", "2;Tâche 2;None;suspended;1"], 1)
+        (True, ['2;Tâche 2;;suspended;None\\n'], (1, 'Tâche 1', [], 'completed', None), [(2, 'Tâche 2', [], 'suspended', None)])
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide, retourne les tâches non modifiées
-        return False, parse_tasks(tasks), None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    original_length = len(parsed_tasks)
-    
-    # Filtre les tâches pour enlever celle avec l'ID spécifié
-    filtered_tasks = []
-    for (tid, desc, lab, status, dep) in parsed_tasks:  
-        if tid != task_id:
-            filtered_tasks.append((tid, desc, lab, status, dep))
-        else:
-            old_task = (tid, desc, lab, status, dep)
-    
-    # Détermine si une tâche a été supprimée
-    found = len(filtered_tasks) < original_length
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, []
 
-    final_tasks = []
+    # Le champ dépendance est le dernier de la ligne: un test de suffixe
+    # suffit à repérer les candidates, seules celles-là sont analysées
+    dep_suffix = ";%d" % task_id
 
-    if found:
-        # Met à jour les dépendances des autres tâches
-        for (tid, desc, lab, status, dep) in filtered_tasks:
-            if dep == task_id:
-                final_tasks.append((tid, desc, lab, status, None))
-            else:
-                final_tasks.append((tid, desc, lab, status, dep))
-    else:
-        final_tasks = filtered_tasks
-        old_task = None
+    new_lines = []
+    changed_tasks = []
+    for j, line in enumerate(tasks):
+        if j == i:
+            # La ligne de la tâche supprimée disparaît
+            continue
+        # rstrip() complet (et pas seulement "\n"): le filtre doit tolérer
+        # les fins CRLF ou les espaces traînants que l'analyseur accepte
+        if line.rstrip().endswith(dep_suffix):
+            parsed = parse_tasks([line])
+            if parsed and parsed[0][4] == task_id:
+                # Efface la dépendance qui pointait vers la tâche retirée
+                tid, desc, lab, status, _ = parsed[0]
+                changed_tasks.append((tid, desc, lab, status, None))
+                new_lines.append(format_line(tid, desc, lab, status, None))
+                continue
+        new_lines.append(line)
 
-    return found, filtered_tasks, old_task
+    return True, new_lines, old_task, changed_tasks
             
-def add_options(tasks, task_id, labels=None, id_dep=None):
+def add_options(tasks, task_id, labels=None, id_dep=None, filename=None):
     """
     Ajoute une ou plusieurs étiquette(s) et/ou dépendance à une tâche existante.
 
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à modifier
+        task_id (int): ID de la tâche à modifier (validé à la frontière CLI)
         labels (list[str], optional): Liste d'étiquette(s) à ajouter (évite les doublons)
         id_dep (int, optional): ID de la tâche dont dépend la tâche cible
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
 
     Returns:
-        tuple: (found: bool, updated_tasks: list, old_task: tuple)
+        tuple: (found: bool, new_lines: list, old_task: tuple, new_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
-            - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
-            
+            - new_lines: Lignes du fichier après modification (seule la ligne
+              de la tâche est resérialisée, les autres restent telles quelles)
+            - old_task: Tuple (id, desc, lab, status, dep) avant modification
+            - new_task: Le même tuple après modification
+
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
         - Les étiquettes en doublon sont automatiquement ignorées
         - Si une dépendance existe déjà, demande confirmation à l'utilisateur
-        - Si l'ID n'est pas numérique, retourne (False, [], None)
+        - Si l'ID n'est pas numérique, retourne (False, [], None, None)
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        return False, [], None
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, None
 
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    old_task = None
-
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, state, dep)
-
-            # Mise à jour des étiquettes
-            if labels is not None:
-                new_lab = lab[:] if lab else []
-                for label in labels:
-                    if label not in new_lab:
-                        new_lab.append(label)
-            else:
-                new_lab = lab
+    tid, desc, lab, state, dep = old_task
+
+    # Mise à jour des étiquettes: fusion ordonnée sans doublons en O(k)
+    # (dict.fromkeys préserve l'ordre d'insertion) au lieu du test
+    # d'appartenance quadratique étiquette par étiquette
+    if labels is not None:
+        new_lab = list(dict.fromkeys([*lab, *labels]))
+    else:
+        new_lab = lab
 
-            # Mise à jour de la dépendance
-            if id_dep is not None:
-                if dep is not None:
-                    # Demande à l'utilisateur s'il veut modifier la dépendance
-                    print(f"Tâche {tid} dépend déjà de la tâche {dep}.")
-                    modify_dep = input("Voulez-vous modifier la dépendance ? (O/N) : ").lower()
-                    while modify_dep not in ["o", "n", "oui", "non"]:
-                        modify_dep = input("Réponse invalide, voulez-vous modifier la dépendance ? (O/N) : ").lower()
-                    if modify_dep in ["o", "oui"]:
-                        dep = id_dep
-                else:
-                    dep = id_dep
+    # Mise à jour de la dépendance
+    if id_dep is not None:
+        if dep is not None:
+            # Demande à l'utilisateur s'il veut modifier la dépendance
+            print(f"Tâche {tid} dépend déjà de la tâche {dep}.")
+            modify_dep = input("Voulez-vous modifier la dépendance ? (O/N) : ").lower()
+            while modify_dep not in ["o", "n", "oui", "non"]:
+                modify_dep = input("Réponse invalide, voulez-vous modifier la dépendance ? (O/N) : ").lower()
+            if modify_dep in ["o", "oui"]:
+                dep = id_dep
+        else:
+            dep = id_dep
 
-            parsed_tasks[i] = (tid, desc, new_lab, state, dep)
-            found = True
-            break
+    # Seule la ligne modifiée est resérialisée
+    new_task = (tid, desc, new_lab, state, dep)
+    new_lines = tasks[:i] + [format_line(*new_task)] + tasks[i + 1:]
 
-    return found, parsed_tasks, old_task
+    return True, new_lines, old_task, new_task
 
-def rmLabel(tasks, task_id):
+def list_labels(tasks, task_id, filename=None):
     """
-    Supprime une étiquette d'une tâche existante en demandant à l'utilisateur quelle étiquette supprimer.
+    Retourne les étiquettes d'une tâche, pour un choix côté interface.
 
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à modifier
+        task_id (int): ID de la tâche (validé à la frontière CLI)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
 
     Returns:
-        tuple: (found: bool, updated_tasks: list, old_task: tuple)
+        list|None: Liste (copie) des étiquettes de la tâche, None si la
+        tâche n'existe pas
+    """
+
+    _, task = _find_line(tasks, task_id, filename)
+    if task is None:
+        return None
+    return task[2][:]
+
+
+def rmLabel(tasks, task_id, label_index, filename=None):
+    """
+    Supprime une étiquette d'une tâche existante par son indice.
+
+    Args:
+        tasks (list): Liste des lignes existantes du fichier de tâches
+        task_id (int): ID de la tâche à modifier (validé à la frontière CLI)
+        label_index (int): Indice de l'étiquette à supprimer (déjà validé
+            côté interface, typiquement choisi via list_labels)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
+
+    Returns:
+        tuple: (found: bool, new_lines: list, old_task: tuple, new_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
-            - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
-            
+            - new_lines: Lignes du fichier après modification (seule la ligne
+              de la tâche est resérialisée, les autres restent telles quelles)
+            - old_task: Tuple (id, desc, lab, status, dep) avant modification
+            - new_task: Le même tuple après modification
+
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
-        - Si l'ID n'est pas numérique, retourne (False, [], None)
-        - Demande interactivement à l'utilisateur quelle étiquette supprimer
-        - Gère la validation robuste de l'entrée utilisateur
-        - Retourne (False, parsed_tasks, None) si l'utilisateur annule (Ctrl+C)
-        
+        Le dialogue utilisateur (affichage des étiquettes, saisie de
+        l'indice) vit dans commands.rmLabel: cette fonction est pure et
+        utilisable en lot, sans blocage sur stdin.
+
     Example:
-        >>> rmLabel(["1;Tâche 1;None;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], "2")
-        # Affiche: 0: tag1, 1: tag2
-        # Utilisateur entre: 0
-        (True, [(1, 'Tâche 1', [], 'suspended', None), (2, 'Tâche 2', ['tag2'], 'started', None)], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
+        >>> rmLabel(["1;Tâche 1;;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], 2, 0)
+        (True, ['1;Tâche 1;;suspended;None', '2;Tâche 2;tag2;started;None\n'], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None), (2, 'Tâche 2', ['tag2'], 'started', None))
     """
-    
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, status, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab[:], status, dep)
-            if lab:
-                print("Étiquettes de la tâche :")
-                for j, label in enumerate(lab):
-                    print(f"{j}: {label}")
-                
-                # Validation robuste de l'entrée utilisateur
-                while True:
-                    try:
-                        n = int(input("Entrez le numéro de l'étiquette à supprimer : "))
-                        if 0 <= n < len(lab):
-                            break
-                        else:
-                            print(f"Le numéro doit être entre 0 et {len(lab)-1}")
-                    except ValueError:
-                        print("Erreur : veuillez entrer un nombre valide")
-                    except KeyboardInterrupt:
-                        print("\nOpération annulée")
-                        return False, parsed_tasks, None
-            
-                # Suppression de l'étiquette
-                lab.pop(n)
-                parsed_tasks[i] = (tid, desc, lab, status, dep)
-            else:
-                print("Cette tâche n'a pas d'étiquettes à supprimer")
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
 
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, None
+
+    tid, desc, lab, status, dep = old_task
+
+    # Suppression de l'étiquette choisie
+    new_lab = lab[:]
+    if 0 <= label_index < len(new_lab):
+        new_lab.pop(label_index)
+
+    # Seule la ligne modifiée est resérialisée
+    new_task = (tid, desc, new_lab, status, dep)
+    new_lines = tasks[:i] + [format_line(*new_task)] + tasks[i + 1:]
 
-def clearLabel(tasks, task_id):
+    return True, new_lines, old_task, new_task
+
+
+def clearLabel(tasks, task_id, filename=None):
     """
     Supprime l'ensemble des étiquettes d'une tâche en utilisant son ID.
 
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à modifier
+        task_id (int): ID de la tâche à modifier (validé à la frontière CLI)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
 
     Returns:
-        tuple: (found: bool, updated_tasks: list, old_task: tuple)
+        tuple: (found: bool, new_lines: list, old_task: tuple, new_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
-            - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche
+            - new_lines: Lignes du fichier après modification (seule la ligne
+              de la tâche est resérialisée, les autres restent telles quelles)
+            - old_task: Tuple (id, desc, lab, status, dep) avant modification
+            - new_task: Le même tuple après modification
 
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
-        - Si l'ID n'est pas numérique, retourne (False, [], None)
-        
+        Une tâche déjà sans étiquettes ressort inchangée (new_task égal à
+        old_task): l'appelant peut alors s'épargner écriture et historique.
+
     Example:
-        >>> clearLabel(["1;Tâche 1;None;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], "2")
-        (True, [(1, 'Tâche 1', [], 'suspended', None), (2, 'Tâche 2', [], 'started', None)], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None))
+        >>> clearLabel(["1;Tâche 1;None;suspended;None", "2;Tâche 2;tag1,tag2;started;None"], 2)
+        (True, ['1;Tâche 1;None;suspended;None', '2;Tâche 2;;started;None\n'], (2, 'Tâche 2', ['tag1', 'tag2'], 'started', None), (2, 'Tâche 2', [], 'started', None))
     """
     
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, status, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, status, dep)
-            parsed_tasks[i] = (tid, desc, [], status, dep)
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, None
+
+    tid, desc, lab, status, dep = old_task
+
+    # Seule la ligne modifiée est resérialisée
+    new_task = (tid, desc, [], status, dep)
+    new_lines = tasks[:i] + [format_line(*new_task)] + tasks[i + 1:]
+
+    return True, new_lines, old_task, new_task
 
-def rmDep(tasks, task_id):
+def rmDep(tasks, task_id, filename=None):
     """
     Supprime la dépendance associée à une tâche en utilisant son ID.
 
     Args:
         tasks (list): Liste des lignes existantes du fichier de tâches
-        task_id (str|int): ID de la tâche à modifier
+        task_id (int): ID de la tâche à modifier (validé à la frontière CLI)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
 
     Returns:
-        tuple: (found: bool, updated_tasks: list, old_task: tuple)
+        tuple: (found: bool, new_lines: list, old_task: tuple, new_task: tuple)
             - found: True si la tâche a été trouvée et modifiée, False sinon
-            - updated_tasks: Liste des tâches mises à jour (tuples à 5 éléments)
-            - old_task: Tuple (id, desc, lab, status, dep) correspondant à l'ancienne tâche avant suppression
+            - new_lines: Lignes du fichier après modification (seule la ligne
+              de la tâche est resérialisée, les autres restent telles quelles)
+            - old_task: Tuple (id, desc, lab, status, dep) avant modification
+            - new_task: Le même tuple après modification
 
     Note:
-        - L'ID peut être fourni comme string ou int, il sera converti
-        - Si l'ID n'est pas numérique, retourne (False, [], None)
-        
+        Une tâche sans dépendance ressort inchangée (new_task égal à
+        old_task): l'appelant peut alors s'épargner écriture et historique.
+
     Example:
-        >>> rmDep(["1;Tâche 1;None;completed;None", "2;Tâche 2;tag1;suspended;1"], "2")
-        (True, [(1, 'Tâche 1', [], 'completed', None), (2, 'Tâche 2', ['tag1'], 'suspended', None)], (2, 'Tâche 2', ['tag1'], 'suspended', 1))
+        >>> rmDep(["1;Tâche 1;None;completed;None", "2;Tâche 2;tag1;suspended;1"], 2)
+        (True, ['1;Tâche 1;None;completed;None', '2;Tâche 2;tag1;suspended;None\n'], (2, 'Tâche 2', ['tag1'], 'suspended', 1), (2, 'Tâche 2', ['tag1'], 'suspended', None))
     """
 
-    # Validation et conversion de l'ID
-    try:
-        task_id = int(task_id)
-    except ValueError:
-        # ID invalide (non numérique)
-        return False, [], None
-        
-    # Parse les tâches existantes
-    parsed_tasks = parse_tasks(tasks)
-    found = False
-    
-    # Recherche et modification de la tâche correspondante
-    for i, (tid, desc, lab, state, dep) in enumerate(parsed_tasks):
-        if tid == task_id:
-            old_task = (tid, desc, lab, state, dep)
-            parsed_tasks[i] = (tid, desc, lab, state, None)
-            found = True
-            break
-    
-    return found, parsed_tasks, old_task
+    # Localise la tâche sans analyser les autres lignes
+    i, old_task = _find_line(tasks, task_id, filename)
+    if i is None:
+        return False, [], None, None
+
+    tid, desc, lab, state, dep = old_task
 
-def show(tasks):
+    # Seule la ligne modifiée est resérialisée
+    new_task = (tid, desc, lab, state, None)
+    new_lines = tasks[:i] + [format_line(*new_task)] + tasks[i + 1:]
+
+    return True, new_lines, old_task, new_task
+
+def show(tasks, filename=None):
     """
     Affiche la liste des tâches dans un tableau formaté, triées par ID.
     
     Args:
-        tasks (list): Liste des lignes du fichier de tâches
+        tasks (iterable): Lignes du fichier de tâches (liste ou itérateur,
+            typiquement iter_task_lines pour un affichage sans
+            matérialisation de la liste des lignes)
+        filename (str, optional): Chemin du fichier de tâches, pour le cache d'analyse
         
     Returns:
         None: Affiche directement le résultat sur stdout
@@ -563,40 +973,60 @@ def show(tasks):
     """
 
     # Parse et vérifie s'il y a des tâches
-    parsed_tasks = parse_tasks(tasks)
+    parsed_tasks = parse_tasks_cached(filename, tasks)
     if not parsed_tasks:
         print("No tasks found.")
         return
     
-    # Trie les tâches par ID croissant
-    sorted_tasks = sorted(parsed_tasks, key=lambda x: x[0])
-    
-    # Calcule la largeur optimale pour la colonne description
-    max_desc_length = max(len(desc) for _, desc, _, _, _ in sorted_tasks) if sorted_tasks else 10
-    max_desc_length = max(max_desc_length, 11)  # Largeur minimale pour "description"
-    
-    # Calcule la largeur optimale pour la colonne étiquette(s)
-    max_lab_length = max(len(", ".join(lab)) for _, _, lab, _, _ in sorted_tasks) if sorted_tasks else 11
-    max_lab_length = max(max_lab_length, 12)  # Largeur minimale pour "étiquette(s)"
+    # Les fichiers écrits par l'outil sont déjà triés (add ajoute max+1 en
+    # fin, rm préserve l'ordre): une vérification linéaire évite le tri et
+    # ses rappels de lambda par élément; seul un fichier édité à la main
+    # déclenche encore le sorted()
+    if any(parsed_tasks[i][0] > parsed_tasks[i + 1][0]
+           for i in range(len(parsed_tasks) - 1)):
+        sorted_tasks = sorted(parsed_tasks, key=lambda x: x[0])
+    else:
+        sorted_tasks = parsed_tasks
 
-    # Largeur dynamique pour état et dépendance
-    max_state_length = max(len(state) for _, _, _, state, _ in sorted_tasks) if sorted_tasks else 6
-    max_state_length = max(max_state_length, 6)  # Largeur minimale
+    # Une seule passe sur les tâches: calcule les quatre largeurs de colonnes
+    # et prépare les chaînes affichées (étiquettes jointes une seule fois)
+    max_desc_length = 11   # Largeur minimale pour "description"
+    max_lab_length = 12    # Largeur minimale pour "étiquette(s)"
+    max_state_length = 6   # Largeur minimale pour "statut"
+    max_dep_length = 10    # Largeur minimale pour "dépendance"
 
-    max_dep_length = max(len(str(dep)) if dep else 4 for _, _, _, _, dep in sorted_tasks) if sorted_tasks else 4
-    max_dep_length = max(max_dep_length, 10)  # Largeur minimale
+    rows = []
+    for task_id, description, labels, state, dep in sorted_tasks:
+        labels_str = ", ".join(labels) if labels else "None"
+        dep_str = str(dep) if dep else "None"
+        n = len(description)
+        if n > max_desc_length:
+            max_desc_length = n
+        n = len(labels_str)
+        if n > max_lab_length:
+            max_lab_length = n
+        n = len(state)
+        if n > max_state_length:
+            max_state_length = n
+        n = len(dep_str)
+        if n > max_dep_length:
+            max_dep_length = n
+        rows.append((task_id, description, labels_str, state, dep_str))
 
     # Construction du tableau
     border_line = f"+-----+{'-' * (max_desc_length + 2)}+{'-' * (max_lab_length + 2)}+{'-' * (max_state_length + 2)}+{'-' * (max_dep_length + 2)}+"
     header_line = f"| {'id':<3} | {'description':<{max_desc_length}} | {'étiquette(s)':<{max_lab_length}} | {'statut':<{max_state_length}} | {'dépendance':<{max_dep_length}} |"
 
-    print(border_line)
-    print(header_line)
-    print(border_line)
-    
-    # Affichage de chaque tâche
-    for task_id, description, labels, state, dep in sorted_tasks:
-        labels_str = ", ".join(labels) if labels else "None"
-        print(f"| {task_id:<3} | {description:<{max_desc_length}} | {labels_str:<{max_lab_length}} | {state:<{max_state_length}} | {dep if dep else 'None':<{max_dep_length}} |")
+    # Gabarit de ligne construit une seule fois, largeurs figées: chaque
+    # ligne se formate par un .format() C sans réanalyser le gabarit
+    row_fmt = (f"| {{0:<3}} | {{1:<{max_desc_length}}} | {{2:<{max_lab_length}}} "
+               f"| {{3:<{max_state_length}}} | {{4:<{max_dep_length}}} |")
+
+    # Assemble tout le tableau puis l'émet en une seule écriture sur stdout:
+    # un seul appel système au lieu d'un print (et d'un flush potentiel) par ligne
+    lines = [border_line, header_line, border_line]
+    for row in rows:
+        lines.append(row_fmt.format(*row))
+    lines.append(border_line)
 
-    print(border_line)
\ No newline at end of file
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
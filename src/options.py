@@ -15,9 +15,51 @@ Commandes disponibles:
     - show                                : Affiche toutes les tâches
 """
 
-import argparse
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
 
+# Commandes sans option, dont la grammaire se réduit à "fichier commande [id]":
+# elles s'analysent à la main sans payer la construction des sous-parseurs
+_SIMPLE_COMMANDS = ("rm", "rmLabel", "clearLabel", "rmDep")
 
+
+def parse_args(argv=None):
+    """
+    Analyse la ligne de commande, par un chemin rapide quand c'est possible.
+
+    Args:
+        argv (list, optional): Arguments (sans le nom du programme),
+            sys.argv[1:] si omis
+
+    Returns:
+        Namespace: Même forme d'objet que create_parser().parse_args()
+
+    Note:
+        Les commandes à grammaire triviale (show, rm, rmLabel, clearLabel,
+        rmDep) sont reconnues directement: l'essentiel du coût de démarrage
+        d'argparse vient de la construction des sous-parseurs, superflue
+        pour "fichier commande [id]". Les commandes à options (add, modify,
+        add_options), l'aide et toute forme inattendue retombent sur le
+        parseur argparse complet, qui garde la main sur les messages
+        d'erreur.
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Au minimum fichier + commande, et pas une demande d'aide (-h/--help)
+    if len(argv) >= 2 and not argv[0].startswith('-'):
+        command = argv[1]
+        if command == 'show' and len(argv) == 2:
+            return SimpleNamespace(file=argv[0], command='show')
+        if command in _SIMPLE_COMMANDS and len(argv) == 3 and not argv[2].startswith('-'):
+            return SimpleNamespace(file=argv[0], command=command, id=argv[2])
+
+    return create_parser().parse_args(argv)
+
+
+@lru_cache(maxsize=1)
 def create_parser():
     """
     Crée et configure l'analyseur de ligne de commande.
@@ -28,7 +70,15 @@ def create_parser():
     Note:
         Utilise des sous-parseurs pour gérer les différentes commandes.
         Chaque commande a ses propres arguments spécifiques.
+        argparse n'est importé qu'ici: le chemin rapide de parse_args ne
+        paie ni l'import ni la construction du parseur.
+        Le parseur construit est mémoïsé: la construction des sous-parseurs
+        domine le coût d'argparse, inutile de la refaire dans un même
+        processus (batch, tests).
     """
+    # Import paresseux: seul le chemin argparse complet en a besoin
+    import argparse
+
     # Création du parseur principal
     parser = argparse.ArgumentParser(
         description='Simple task manager - Gestionnaire de tâches en ligne de commande',
@@ -92,15 +142,22 @@ def create_parser():
         help='Nouveau statut de la tâche'
     )
     
-    # === Commande RM (Remove) ===
+    # === Commandes À ID SEUL (rm, rmLabel, clearLabel, rmDep) ===
+    # Ces quatre commandes partagent exactement la même grammaire
+    # ("fichier commande id"): un seul sous-parseur avec alias suffit,
+    # options.command garde le nom réellement tapé. Trois constructions
+    # de sous-parseur en moins au démarrage.
     parser_rm = subparsers.add_parser(
-        'rm', 
-        help='Supprimer une tâche',
-        description='Supprime définitivement une tâche en utilisant son ID'
+        'rm',
+        aliases=['rmLabel', 'clearLabel', 'rmDep'],
+        help="Supprimer une tâche (rm), une étiquette (rmLabel), toutes les "
+             "étiquettes (clearLabel) ou la dépendance (rmDep) d'une tâche",
+        description='Supprime la tâche, une étiquette, toutes les étiquettes '
+                    'ou la dépendance de la tâche désignée par son ID'
     )
     parser_rm.add_argument(
         'id', 
-        help="ID numérique de la tâche à supprimer"
+        help="ID numérique de la tâche visée"
     )
 
     # === Commande ADD_OPTIONS ===
@@ -124,41 +181,9 @@ def create_parser():
         help="ID de la tâche dont on souhaite faire dépendre"
     )
 
-    # === Commande RMLABEL ===
-    parser_rmLabel = subparsers.add_parser(
-        'rmLabel',
-        help="Supprimer une étiquette d'une tâche",
-        description="Supprime une étiquette d'une tâche existante en demandant à l'utilisateur quelle étiquette supprimer"
-    )
-    parser_rmLabel.add_argument(
-        'id',
-        help="ID numérique de la tâche"
-    )
-
-    # === Commande CLEARLABEL ===
-    parser_clearLabel = subparsers.add_parser(
-        'clearLabel',
-        help="Supprimer l'ensemble des étiquettes d'une tâche",
-        description="Supprime l'ensemble des étiquettes d'une tâche en utilisant son ID"
-    )
-    parser_clearLabel.add_argument(
-        'id',
-        help="ID numérique de la tâche dont on veut supprimer les étiquettes"
-    )
-
-    # === Commande RMDEP ===
-    parser_rmDep = subparsers.add_parser(
-        'rmDep',
-        help="Supprimer la dépendance d'une tâche",
-        description="Supprime la dépendance d'une tâche en utilisant son ID"
-    )
-    parser_rmDep.add_argument(
-        'id',
-        help="ID numérique de la tâche dont on veut supprimer la dépendance"
-    )
-    
     # === Commande SHOW ===
-    parser_show = subparsers.add_parser(
+    # Pas d'argument: inutile de garder une référence au sous-parseur
+    subparsers.add_parser(
         'show', 
         help='Afficher toutes les tâches',
         description='Affiche la liste de toutes les tâches dans un tableau formaté'
@@ -28,96 +28,87 @@ Exemples:
 """
 
 import commands
-from options import create_parser
+import core
+from options import parse_args
+
+
+# === EXÉCUTION DES COMMANDES ===
+# Un petit adaptateur par commande: passe les bonnes options au module commands
+
+def _run_add(store, options):
+    """Ajoute une nouvelle tâche (disjonction de cas selon les options)."""
+    if options.labels and options.status:
+        commands.add(store, ' '.join(options.details), options.labels, options.status)
+    elif options.labels:
+        commands.add(store, ' '.join(options.details), options.labels)
+    elif options.status:
+        commands.add(store, ' '.join(options.details), status = options.status)
+    else:
+        commands.add(store, ' '.join(options.details))
+
+
+def _run_modify(store, options):
+    """Modifie la description et/ou le statut d'une tâche existante."""
+    if options.details and options.status:
+        commands.modify(store, options.id, ' '.join(options.details), options.status)
+    elif options.details:
+        commands.modify(store, options.id, ' '.join(options.details))
+    elif options.status:
+        commands.modify(store, options.id, new_status = options.status)
+    else:
+        print("Erreur: Absence de description ou de statut à modifier")
+
+
+def _run_add_options(store, options):
+    """Ajoute étiquettes et/ou dépendance à une tâche existante."""
+    labels = options.labels if options.labels else None
+    dep = options.dependence if options.dependence else None
+    commands.add_options(store, options.id, new_labels=labels, id_dep=dep)
+
+
+# Table de dispatch: une recherche de dict remplace l'échelle de if/elif
+DISPATCH = {
+    'add': _run_add,
+    'modify': _run_modify,
+    'rm': lambda store, options: commands.rm(store, options.id),
+    'add_options': _run_add_options,
+    'rmLabel': lambda store, options: commands.rmLabel(store, options.id),
+    'clearLabel': lambda store, options: commands.clearLabel(store, options.id),
+    'rmDep': lambda store, options: commands.rmDep(store, options.id),
+    'show': lambda store, options: commands.show(store),
+}
 
 # === ANALYSE DES ARGUMENTS ===
-# Création et utilisation du parseur de ligne de commande
-options = create_parser().parse_args()
+# Analyse de la ligne de commande (chemin rapide sans argparse pour les
+# commandes sans option, voir options.parse_args)
+options = parse_args()
 
 try:
     # === LECTURE DU FICHIER DE TÂCHES ===
-    # Tente de lire le fichier existant
-    with open(options.file, 'r') as f:
-        tasks = f.readlines()
-    
-    # === EXÉCUTION DE LA COMMANDE ===
-    # Dispatch vers la fonction appropriée selon la commande
-
-    ## Commandes de base
-    if options.command == 'add':
-        # Disjonction de cas selon les options
-        if options.labels and options.status:
-            # Ajoute une nouvelle tâche
-            commands.add(' '.join(options.details), options.file, tasks, options.labels, options.status)
-        elif options.labels:
-            # Ajoute une nouvelle tâche
-            commands.add(' '.join(options.details), options.file, tasks, options.labels)
-        elif options.status:
-            # Ajoute une nouvelle tâche
-            commands.add(' '.join(options.details), options.file, tasks, status = options.status)
-        else:
-            commands.add(' '.join(options.details), options.file, tasks)
-
-        
-    elif options.command == 'modify':
-        # Disjonction de cas selon les options
-        if options.details and options.status:
-            # Modifie la description d'une tâche existante
-            commands.modify(options.id, options.file, tasks, ' '.join(options.details), options.status)
-        elif options.details:
-            # Modifie la description d'une tâche existante
-            commands.modify(options.id, options.file, tasks, ' '.join(options.details))
-        elif options.status:
-            # Modifie la description d'une tâche existante
-            commands.modify(options.id, options.file, tasks, new_status = options.status)
-        else:
-            print("Erreur: Absence de description ou de statut à modifier")
-        
-    elif options.command == 'rm':
-        # Supprime une tâche
-        commands.rm(options.id, options.file, tasks)
-
-    elif options.command == 'add_options':
-        # Prépare les labels et la dépendance
-        labels = options.labels if options.labels else None
-        dep = options.dependence if options.dependence else None
-
-        # Appelle la fonction une seule fois
-        commands.add_options(options.id, options.file, tasks, new_labels=labels, id_dep=dep)
-      
-    elif options.command == 'rmLabel':
-        # Supprime une étiquette en demandant à l'utilisateur le label à supprimer
-        commands.rmLabel(options.id, options.file, tasks)
-    
-    elif options.command == 'clearLabel':
-        # Supprime l'ensemble des étiquettes d'une tâche
-        commands.clearLabel(options.id, options.file, tasks)
-    
-    elif options.command == 'rmDep':
-        # Supprime la dépendance d'une tâche
-        commands.rmDep(options.id, options.file, tasks)
-        
-    ## Affichage
-    elif options.command == 'show':
-        # Affiche toutes les tâches
-        commands.show(tasks)
-        
+    # Lit (et analyse) le fichier une seule fois pour toute l'invocation.
+    # Pour show, lecture seule, les lignes sont itérées à la volée sans
+    # matérialiser la liste complète en mémoire.
+    if options.command == 'show':
+        store = core.TaskStore(options.file, lines=core.iter_task_lines(options.file))
+    else:
+        store = core.TaskStore(options.file)
+
+    DISPATCH[options.command](store, options)
+
 except FileNotFoundError:
     # === GESTION DES FICHIERS INEXISTANTS ===
     # Gère le cas où le fichier de tâches n'existe pas encore
     if options.command == 'add':
         # Permet d'ajouter la première tâche dans un nouveau fichier
         labels = options.labels if hasattr(options, 'labels') and options.labels else None
-        commands.add(' '.join(options.details), options.file, [], labels)
-    elif options.command == 'add_options':
-        # Impossible d'ajouter une étiquette dans un fichier inexistant
-        print(f"Error: The file {options.file} was not found")
-    elif options.command == 'modify':
-        # Impossible de modifier dans un fichier inexistant
-        print(f"Error: The file {options.file} was not found")
-    elif options.command in ['rm', 'rmLabel', 'clearLabel', 'rmDep']:
-        # Impossible de supprimer dans un fichier inexistant
-        print(f"Error: The file {options.file} was not found")
+        commands.add(core.TaskStore(options.file, lines=[]), ' '.join(options.details), labels)
     elif options.command == 'show':
         # Affiche un message approprié pour un fichier vide
         print("No tasks found.")
+    else:
+        # Impossible de modifier/supprimer dans un fichier inexistant
+        print(f"Error: The file {options.file} was not found")
+
+# === FIN DE COMMANDE ===
+# Garantit que l'entrée d'historique de la commande est sur disque
+commands.flush_history()